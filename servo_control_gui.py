@@ -1,5 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import concurrent.futures
+import ctypes
+import os
+import queue
+import sys
 import threading
 import time
 import struct
@@ -37,6 +42,24 @@ CW_HALT = 0x100
 CW_START_MOVE_ABS = 0x1F
 CW_START_MOVE_REL = 0x5F
 
+# Cyclic communication timing
+CYCLE_PERIOD_NS = 1_000_000 # 1 ms bus cycle
+RECEIVE_TIMEOUT_US = 500 # Frame wait per cycle; kept below the cycle period
+# Command stage delays are wall-clock times, so they hold even when cycles overrun
+# or time.sleep is coarse (e.g. ~15.6 ms on Windows before Python 3.11)
+STATE_TRANSITION_NS = 100_000_000 # 100 ms for the drive's state machine to settle
+SETPOINT_HOLD_NS = 10_000_000 # 10 ms between set-point control word changes
+STAGE_READY_TIMEOUT_NS = 1_000_000_000 # Apply a gated stage anyway after 1 s
+# GIL hand-off interval (s) while communicating; well below one bus cycle so the
+# comm thread is not held off by the Tk mainloop (interpreter default is 5 ms)
+GIL_SWITCH_INTERVAL = 0.0002
+STATUS_UPDATE_MS = 50 # GUI status refresh period
+# Opt-in comm thread placement: set to a core isolated from the OS scheduler
+# (isolcpus) to pin the thread there with real-time priority. None leaves the
+# thread unpinned at normal priority.
+COMM_THREAD_CPU = None
+COMM_THREAD_RT_PRIORITY = 80 # SCHED_FIFO priority on Linux
+
 # Status Word Masks (Bits) for human-readable status
 SW_READY_TO_SWITCH_ON = 0x0001
 SW_SWITCHED_ON = 0x0002
@@ -47,8 +70,128 @@ SW_QUICK_STOP = 0x0020
 SW_SWITCH_ON_DISABLED = 0x0040
 SW_WARNING = 0x0080
 SW_TARGET_REACHED = 0x0400
+SW_SETPOINT_ACKNOWLEDGE = 0x1000 # Profile Position mode
 SW_INTERNAL_LIMIT_ACTIVE = 0x0800
 
+_INT32_RANGE = range(-2**31, 2**31) # Valid Target Position / Target Velocity values
+
+# SDO abort code: unsupported access to an object (e.g. no complete access)
+SDO_ABORT_UNSUPPORTED_ACCESS = 0x06010000
+
+# PDO mapping entries: object index (16 bit), subindex (8 bit), bit length (8 bit)
+RXPDO_MAPPING = ( # Master -> Drive
+    0x60400010, # Control Word
+    0x607A0020, # Target Position
+    0x60FF0020, # Target Velocity
+    0x60600008, # Modes of Operation
+)
+TXPDO_MAPPING = ( # Drive -> Master
+    0x60410010, # Status Word
+    0x60640020, # Position Actual Value
+    0x606C0020, # Velocity Actual Value
+    0x60610008, # Modes of Operation Display
+)
+
+def _pdo_object(index, entry_format, entries):
+    """
+    Pre-serializes a PDO assign/mapping object as (index, complete access
+    payload, per-subindex payloads). In complete access, subindex 0 (count)
+    is padded to 16 bits and followed by all entries.
+    """
+    entry_struct = struct.Struct('<' + entry_format)
+    ca_data = struct.pack(f'<Bx{len(entries)}{entry_format}', len(entries), *entries)
+    return index, ca_data, tuple(entry_struct.pack(entry) for entry in entries)
+
+# Written in this order: assign RxPDO/TxPDO, then their mappings
+_PDO_OBJECTS = (
+    _pdo_object(0x1C12, 'H', (0x1600,)), # RxPDO assignment
+    _pdo_object(0x1C13, 'H', (0x1A00,)), # TxPDO assignment
+    _pdo_object(0x1600, 'I', RXPDO_MAPPING), # RxPDO mapping (Master -> Drive)
+    _pdo_object(0x1A00, 'I', TXPDO_MAPPING), # TxPDO mapping (Drive -> Master)
+)
+
+
+def _pin_current_thread(cpu, rt_priority):
+    """
+    Best effort: pins the calling thread to one CPU core and raises its
+    scheduling priority. Does nothing when cpu is None. Failures (e.g.
+    missing privileges) are ignored.
+    """
+    if cpu is None:
+        return
+
+    if hasattr(os, "sched_setaffinity"): # Linux
+        tid = threading.get_native_id()
+        try:
+            os.sched_setaffinity(tid, {cpu})
+        except OSError:
+            pass
+        try:
+            os.sched_setscheduler(tid, os.SCHED_FIFO, os.sched_param(rt_priority))
+        except (OSError, AttributeError):
+            pass
+    elif sys.platform == "win32":
+        try:
+            from ctypes import wintypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentThread.restype = wintypes.HANDLE
+            kernel32.SetThreadAffinityMask.argtypes = (wintypes.HANDLE, ctypes.c_size_t)
+            kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t
+            kernel32.SetThreadPriority.argtypes = (wintypes.HANDLE, ctypes.c_int)
+            thread = kernel32.GetCurrentThread()
+            kernel32.SetThreadAffinityMask(thread, 1 << cpu)
+            kernel32.SetThreadPriority(thread, 15) # THREAD_PRIORITY_TIME_CRITICAL
+        except Exception:
+            pass # Never let tuning take down the comm thread
+
+
+def _decode_status_word(sw):
+    if sw & SW_FAULT: return "Fault"
+    if not (sw & SW_READY_TO_SWITCH_ON): return "Not Ready"
+    if sw & SW_SWITCH_ON_DISABLED: return "Switch On Disabled"
+    if (sw & 0x04F7) == 0x0031: return "Switched On"
+    if (sw & 0x04F7) == 0x0037: return "Operation Enabled"
+    if (sw & 0x04F7) == 0x0021: return "Ready to Switch On"
+    return "Unknown State"
+
+# The decoded state only depends on status word bits 0-7 and 10, so it is
+# precomputed for all 512 combinations, keyed by bits 0-7 plus bit 10 as bit 8
+_SW_TABLE = tuple(_decode_status_word((key & 0xFF) | ((key & 0x100) << 2)) for key in range(512))
+
+
+class RxPDO(ctypes.LittleEndianStructure):
+    """RxPDO image (Master -> Drive) as mapped by RXPDO_MAPPING."""
+    _pack_ = 1
+    _fields_ = [
+        ("cw", ctypes.c_uint16),   # Control Word
+        ("tpos", ctypes.c_int32),  # Target Position
+        ("tvel", ctypes.c_int32),  # Target Velocity
+        ("mode", ctypes.c_int8),   # Modes of Operation
+    ]
+
+
+class Telemetry(ctypes.LittleEndianStructure):
+    """
+    TxPDO image (Drive -> Master) as mapped by TXPDO_MAPPING; used as the
+    drive feedback record filled in place by EtherCATController.read_into.
+    """
+    _pack_ = 1
+    _fields_ = [
+        ("sw", ctypes.c_uint16),   # Status Word
+        ("pos", ctypes.c_int32),   # Position Actual Value
+        ("vel", ctypes.c_int32),   # Velocity Actual Value
+        ("mode", ctypes.c_int8),   # Modes of Operation Display
+    ]
+
+_TELEMETRY_SIZE = ctypes.sizeof(Telemetry)
+
+# Ready conditions for gated command stages, evaluated on the latest TxPDO
+def _in_profile_position(telemetry):
+    return telemetry.mode == MODE_PROFILED_POSITION
+
+def _setpoint_acknowledged(telemetry):
+    return bool(telemetry.sw & SW_SETPOINT_ACKNOWLEDGE)
+
 
 class EtherCATController:
     """
@@ -68,7 +211,19 @@ class EtherCATController:
         # Assign the configuration function to be called by config_map
         self.drive_slave.config_func = self._drive_setup_func
         self.comm_thread = None
+        # Overlapped process data (one LRW frame carrying outputs and inputs over
+        # the same IOmap area) needs pysoem's overlap API; fall back otherwise
+        self._overlap = (hasattr(self._master, "config_overlap_map")
+                         and hasattr(self._master, "send_overlap_processdata"))
+        self._out_buf = None
+        self._prev_out = None # Image known to have gone out on the bus
+        self._out_pending = False # Image written to pysoem but not yet sent and acknowledged
+        self._output_takes_buffer = False # pysoem accepts _out_buf itself as output
+        self._rx = None # RxPDO fields overlaid on _out_buf
         self.is_running = False
+        self.cycle_count = 0
+        self._cmd_q = queue.SimpleQueue() # Command stages, applied by the comm thread
+        self._saved_switch_interval = None
         self.current_state = "INIT"
 
     def _drive_setup_func(self, slave_pos):
@@ -77,39 +232,33 @@ class EtherCATController:
         to configure the slave's PDOs.
         """
         # --- PDO Configuration (requires PRE-OP state, handled by pysoem) ---
-        # The 'ca' parameter (complete access) should be False when writing to a single subindex.
+        sdo_write = self.drive_slave.sdo_write
         
-        # Assign RxPDO
-        self.drive_slave.sdo_write(0x1c12, 0, b'\x00', False) # Clear RxPDO count
-        self.drive_slave.sdo_write(0x1c12, 1, struct.pack('H', 0x1600), False) # Set 1st RxPDO to 0x1600
-        self.drive_slave.sdo_write(0x1c12, 0, b'\x01', False) # Set RxPDO count to 1
-        
-        # Assign TxPDO
-        self.drive_slave.sdo_write(0x1c13, 0, b'\x00', False) # Clear TxPDO count
-        self.drive_slave.sdo_write(0x1c13, 1, struct.pack('H', 0x1a00), False) # Set 1st TxPDO to 0x1a00
-        self.drive_slave.sdo_write(0x1c13, 0, b'\x01', False) # Set TxPDO count to 1
-
-        # Configure RxPDO mapping (Master -> Drive)
-        self.drive_slave.sdo_write(0x1600, 0, b'\x00', False) # Clear mapping
-        self.drive_slave.sdo_write(0x1600, 1, struct.pack('<I', 0x60400010), False) # Control Word
-        self.drive_slave.sdo_write(0x1600, 2, struct.pack('<I', 0x607A0020), False) # Target Position
-        self.drive_slave.sdo_write(0x1600, 3, struct.pack('<I', 0x60FF0020), False) # Target Velocity
-        self.drive_slave.sdo_write(0x1600, 4, struct.pack('<I', 0x60600008), False) # Modes of Operation
-        self.drive_slave.sdo_write(0x1600, 0, b'\x04', False) # Set number of mapped objects
-
-        # Configure TxPDO mapping (Drive -> Master)
-        self.drive_slave.sdo_write(0x1A00, 0, b'\x00', False) # Clear mapping
-        self.drive_slave.sdo_write(0x1A00, 1, struct.pack('<I', 0x60410010), False) # Status Word
-        self.drive_slave.sdo_write(0x1A00, 2, struct.pack('<I', 0x60640020), False) # Position Actual Value
-        self.drive_slave.sdo_write(0x1A00, 3, struct.pack('<I', 0x606C0020), False) # Velocity Actual Value
-        self.drive_slave.sdo_write(0x1A00, 4, struct.pack('<I', 0x60610008), False) # Modes of Operation Display
-        self.drive_slave.sdo_write(0x1A00, 0, b'\x04', False) # Set number of mapped objects
+        # Write each object in one complete access (ca=True) SDO transfer
+        try:
+            for index, ca_data, _ in _PDO_OBJECTS:
+                sdo_write(index, 0, ca_data, True)
+            return
+        except pysoem.SdoError as e:
+            if e.abort_code != SDO_ABORT_UNSUPPORTED_ACCESS:
+                raise
+
+        # The drive does not support complete access: write subindex by subindex.
+        # The 'ca' parameter (complete access) should be False when writing to a single subindex.
+        for index, _, entries in _PDO_OBJECTS:
+            sdo_write(index, 0, b'\x00', False) # Clear count
+            for subindex, entry in enumerate(entries, 1):
+                sdo_write(index, subindex, entry, False)
+            sdo_write(index, 0, bytes((len(entries),)), False) # Set number of entries
 
     def start_communication(self):
         """Initializes the slave and starts the communication thread."""
         
         self._master.config_dc()
-        self._master.config_map()
+        if self._overlap:
+            self._master.config_overlap_map()
+        else:
+            self._master.config_map()
         
         self._master.read_state()
         if self._master.state_check(pysoem.SAFEOP_STATE, timeout=5000000) != pysoem.SAFEOP_STATE:
@@ -120,6 +269,26 @@ class EtherCATController:
                                f"Slave 1 is in state {self.drive_slave.state:#x} "
                                f"with AL Status Code {al_status_code:#06x} ({al_status_string})")
 
+        output_size = len(self.drive_slave.output)
+        if output_size < ctypes.sizeof(RxPDO):
+            raise RuntimeError(f"RxPDO image is {output_size} bytes, expected at least "
+                               f"{ctypes.sizeof(RxPDO)}. Check that the drive accepted the "
+                               f"PDO mapping (0x1600/0x1C12).")
+
+        # Persistent RxPDO image; commands are packed into it in place
+        self._out_buf = bytearray(output_size)
+        self._rx = RxPDO.from_buffer(self._out_buf)
+        self._prev_out = bytearray(self._out_buf)
+        # pysoem builds whose output setter takes any buffer object skip the bytes() copy
+        try:
+            self.drive_slave.output = self._out_buf
+            self._output_takes_buffer = True
+        except TypeError:
+            self._output_takes_buffer = False
+
+        self._saved_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(GIL_SWITCH_INTERVAL)
+
         self.is_running = True
         self.comm_thread = threading.Thread(target=self._communication_loop)
         self.comm_thread.daemon = True
@@ -146,6 +315,10 @@ class EtherCATController:
             self.is_running = False
             if self.comm_thread:
                 self.comm_thread.join()
+
+        if self._saved_switch_interval is not None:
+            sys.setswitchinterval(self._saved_switch_interval)
+            self._saved_switch_interval = None
         
         if self._master.context_initialized:
             self._master.state = pysoem.INIT_STATE
@@ -153,90 +326,176 @@ class EtherCATController:
             self._master.close()
 
     def _communication_loop(self):
+        _pin_current_thread(COMM_THREAD_CPU, COMM_THREAD_RT_PRIORITY)
+
+        # Bind per-cycle lookups once; this loop runs at 1 kHz
+        send = self._master.send_overlap_processdata if self._overlap else self._master.send_processdata
+        receive = self._master.receive_processdata
+        expected_wkc = self._master.expected_wkc
+        apply_stage = self._apply_stage
+        read_into = self.read_into
+        telemetry = Telemetry() # Feedback for gated stages, owned by this thread
+        queue_empty = self._cmd_q.empty
+        queue_get = self._cmd_q.get_nowait
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
+
+        hold_until = 0 # monotonic_ns time before which no further stage is applied
+        stage = None # Dequeued stage still waiting for its ready condition
+        stage_since = 0
+        next_t = monotonic_ns()
         while self.is_running:
-            self._master.send_processdata()
-            self._master.receive_processdata(timeout=2000)
-            time.sleep(0.01)
-
-    def _write_pdo(self, offset, data):
-        """Writes data to a specific offset in the slave's output process data."""
-        # Create a mutable copy of the current output process data
-        output_data = bytearray(self.drive_slave.output)
-        
-        # Modify the slice with the new data
-        output_data[offset:offset+len(data)] = data
-        
-        # Write the entire modified buffer back
-        self.drive_slave.output = bytes(output_data)
-
-    def _read_pdo(self, offset, length):
-        return self.drive_slave.input[offset:offset+length]
+            send()
+            wkc = receive(RECEIVE_TIMEOUT_US)
+            self.cycle_count += 1
+
+            # A pending image went out with this frame; once every slave has
+            # acknowledged it, it is what the drive holds
+            if self._out_pending and wkc >= expected_wkc:
+                self._prev_out[:] = self._out_buf
+                self._out_pending = False
+
+            # Apply queued stages only between receive and the next send: on the
+            # non-overlapped path receive copies the sent LRW datagram back over
+            # the outputs, clobbering anything written while the frame was out.
+            # Stages without a delay are coalesced into the same cycle; a delayed
+            # stage always goes out in at least one frame before the next one.
+            # A stage with a ready condition waits until the drive's feedback
+            # satisfies it (or STAGE_READY_TIMEOUT_NS passes).
+            now = monotonic_ns()
+            while now >= hold_until:
+                if stage is None:
+                    if queue_empty():
+                        break
+                    stage = queue_get()
+                    stage_since = now
+                ready = stage[5]
+                if ready is not None and now - stage_since < STAGE_READY_TIMEOUT_NS:
+                    read_into(telemetry)
+                    if not ready(telemetry):
+                        break
+                delay_ns = apply_stage(stage)
+                stage = None
+                if delay_ns:
+                    hold_until = now + delay_ns
+
+            # Sleep until the next absolute deadline so jitter does not accumulate
+            next_t += CYCLE_PERIOD_NS
+            now = monotonic_ns()
+            if now >= next_t:
+                # Overran (e.g. lost frames): skip the missed periods, but still
+                # sleep up to the next period boundary instead of spinning
+                next_t += ((now - next_t) // CYCLE_PERIOD_NS + 1) * CYCLE_PERIOD_NS
+            sleep((next_t - now) / 1e9)
+
+    def _apply_stage(self, stage):
+        """Applies one command stage to the RxPDO and returns its delay in ns."""
+        cw, mode, pos, vel, delay_ns, _ = stage
+        rx = self._rx
+        if cw is not None: rx.cw = cw
+        if mode is not None: rx.mode = mode
+        if pos is not None: rx.tpos = pos
+        if vel is not None: rx.tvel = vel
+        self._commit()
+        return delay_ns
+
+    def _submit(self, *stages):
+        """
+        Queues (cw, mode, pos, vel, delay_ns, ready) stages for the comm thread.
+        A None field is left unchanged; the next stage is applied no sooner
+        than delay_ns later. If ready is set, the stage waits until
+        ready(telemetry) is true for the drive's feedback.
+        """
+        put = self._cmd_q.put
+        for stage in stages:
+            put(stage)
+
+    def _commit(self):
+        """Writes the RxPDO image to the slave's output process data at once."""
+        # Idempotent commands (e.g. repeated Enable Operation) leave the image as
+        # is, unless an earlier write has not been confirmed on the bus yet
+        if not self._out_pending and self._out_buf == self._prev_out:
+            return
+
+        if self._output_takes_buffer:
+            self.drive_slave.output = self._out_buf
+        else:
+            self.drive_slave.output = bytes(self._out_buf) # Setter only accepts bytes
+        self._out_pending = True
 
     def reset_fault(self):
-        control_word = struct.pack('<H', CW_FAULT_RESET)
-        self._write_pdo(0, control_word)
-        time.sleep(0.1)
-        control_word = struct.pack('<H', 0)
-        self._write_pdo(0, control_word)
+        self._submit(
+            (CW_FAULT_RESET, None, None, None, STATE_TRANSITION_NS, None),
+            (0, None, None, None, 0, None),
+        )
         
     def shutdown(self):
-        self._write_pdo(0, struct.pack('<H', CW_SHUTDOWN))
+        self._submit((CW_SHUTDOWN, None, None, None, 0, None))
 
     def switch_on(self):
-        self._write_pdo(0, struct.pack('<H', CW_SWITCH_ON))
+        self._submit((CW_SWITCH_ON, None, None, None, 0, None))
 
     def enable_operation(self):
-        self._write_pdo(0, struct.pack('<H', CW_ENABLE_OPERATION))
+        self._submit((CW_ENABLE_OPERATION, None, None, None, 0, None))
+
+    def enable_drive(self):
+        """Runs the CiA 402 sequence Shutdown -> Switch On -> Enable Operation."""
+        self._submit(
+            (CW_SHUTDOWN, None, None, None, STATE_TRANSITION_NS, None),
+            (CW_SWITCH_ON, None, None, None, STATE_TRANSITION_NS, None),
+            (CW_ENABLE_OPERATION, None, None, None, 0, None),
+        )
 
     def set_operation_mode(self, mode):
-        self._write_pdo(10, struct.pack('b', mode))
+        self._submit((None, mode, None, None, 0, None))
 
     def set_target_velocity(self, velocity):
-        self._write_pdo(6, struct.pack('<i', velocity))
+        if velocity not in _INT32_RANGE:
+            raise OverflowError("Target velocity is outside the 32-bit range.")
+        self._submit((None, None, None, velocity, 0, None))
     
     def set_target_position(self, position):
-        self._write_pdo(2, struct.pack('<i', position))
+        if position not in _INT32_RANGE:
+            raise OverflowError("Target position is outside the 32-bit range.")
+        self._submit((None, None, position, None, 0, None))
 
     def trigger_position_move(self):
-        self._write_pdo(0, struct.pack('<H', CW_ENABLE_OPERATION))
-        time.sleep(0.01)
-        self._write_pdo(0, struct.pack('<H', CW_START_MOVE_ABS))
-        time.sleep(0.01)
-        self._write_pdo(0, struct.pack('<H', CW_ENABLE_OPERATION))
+        self._submit(*self._position_move_stages())
 
-    def get_status(self):
-        try:
-            sw_data = self._read_pdo(0, 2)
-            pa_data = self._read_pdo(2, 4)
-            va_data = self._read_pdo(6, 4)
-            md_data = self._read_pdo(10, 1)
-
-            status_word = struct.unpack('<H', sw_data)[0]
-            actual_position = struct.unpack('<i', pa_data)[0]
-            actual_velocity = struct.unpack('<i', va_data)[0]
-            mode_display = struct.unpack('b', md_data)[0]
-            
-            return {
-                "status_word": status_word,
-                "actual_position": actual_position,
-                "actual_velocity": actual_velocity,
-                "mode_display": mode_display,
-            }
-        except (IndexError, struct.error):
-            return {
-                "status_word": 0, "actual_position": 0,
-                "actual_velocity": 0, "mode_display": 0,
-            }
+    @staticmethod
+    def _position_move_stages(mode=None, position=None):
+        # A rising edge on bit 4 (new set-point) starts the move. Target and mode
+        # go out first; the edge is raised only once the drive reports Profile
+        # Position mode, and cleared once it acknowledges the set-point
+        return (
+            (CW_ENABLE_OPERATION, mode, position, None, SETPOINT_HOLD_NS, None),
+            (CW_START_MOVE_ABS, None, None, None, 0, _in_profile_position),
+            (CW_ENABLE_OPERATION, None, None, None, 0, _setpoint_acknowledged),
+        )
+
+    def move_to_position(self, position):
+        """Switches to Profile Position mode and starts an absolute move in one go."""
+        if position not in _INT32_RANGE:
+            raise OverflowError("Target position is outside the 32-bit range.")
+        self._submit(*self._position_move_stages(MODE_PROFILED_POSITION, position))
+
+    def run_at_velocity(self, velocity):
+        """Switches to Profile Velocity mode and sets the target velocity in one write."""
+        if velocity not in _INT32_RANGE:
+            raise OverflowError("Target velocity is outside the 32-bit range.")
+        self._submit((None, MODE_PROFILED_VELOCITY, None, velocity, 0, None))
+
+    def read_into(self, target):
+        """Decodes the latest TxPDO image straight into a caller-owned Telemetry record."""
+        # pysoem hands out a fresh (read-only) snapshot of the input image on
+        # every access, so it is copied over the record rather than overlaid
+        data = self.drive_slave.input
+        if len(data) >= _TELEMETRY_SIZE: # Otherwise not mapped (yet); keep the last values
+            ctypes.memmove(ctypes.addressof(target), data, _TELEMETRY_SIZE)
             
     @staticmethod
     def parse_status_word(sw):
-        if sw & SW_FAULT: return "Fault"
-        if not (sw & SW_READY_TO_SWITCH_ON): return "Not Ready"
-        if sw & SW_SWITCH_ON_DISABLED: return "Switch On Disabled"
-        if (sw & 0x04F7) == 0x0031: return "Switched On"
-        if (sw & 0x04F7) == 0x0037: return "Operation Enabled"
-        if (sw & 0x04F7) == 0x0021: return "Ready to Switch On"
-        return "Unknown State"
+        return _SW_TABLE[(sw & 0xFF) | ((sw >> 2) & 0x100)]
 
 class ServoGUI:
     def __init__(self, root):
@@ -247,14 +506,20 @@ class ServoGUI:
 
         self.controller = None
         self.update_job = None
+        # Single reusable worker for blocking EtherCAT calls, keeping Tk responsive
+        self._worker = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._connect_future = None # Pending controller bring-up, if any
+        self._last = (None,) * 4 # Last displayed (sw, pos, vel, mode)
+        self._last_cycle = None # Bus cycle the display was last refreshed from
+        self._telemetry = Telemetry()
 
         self.iface_name = tk.StringVar(value="\\Device\\NPF_{B0BE6AD4-7066-42CB-B5A1-B0E2503F8B9A}")
         self.connection_status = tk.StringVar(value="Disconnected")
         self.drive_state = tk.StringVar(value="N/A")
         self.status_word_val = tk.StringVar(value="0x0000")
-        self.actual_pos_val = tk.StringVar(value="0")
-        self.actual_vel_val = tk.StringVar(value="0")
-        self.mode_display_val = tk.StringVar(value="N/A")
+        self.actual_pos_val = tk.IntVar(value=0)
+        self.actual_vel_val = tk.IntVar(value=0)
+        self.mode_display_val = tk.IntVar(value=0)
         self.operation_mode = tk.IntVar(value=MODE_PROFILED_POSITION)
         self.target_pos = tk.StringVar(value="100000")
         self.target_vel = tk.StringVar(value="50000")
@@ -345,28 +610,48 @@ class ServoGUI:
             self.connect()
 
     def connect(self):
-        try:
-            self.controller = EtherCATController(self.iface_name.get())
-            self.controller.start_communication()
-            
-            self.connection_status.set(f"Connected to {self.controller.slave_count} slave(s)")
-            self.connect_btn.config(text="Disconnect")
-            self._toggle_controls(tk.NORMAL)
-            
-            self.start_status_updates()
+        # Bringing the bus to OP can block for seconds, so it runs on the worker
+        self.connect_btn.config(state=tk.DISABLED)
+        self.connection_status.set("Connecting...")
+        future = self._worker.submit(self._open_controller, self.iface_name.get())
+        self._connect_future = future
+        self.root.after(STATUS_UPDATE_MS, self._finish_connect, future)
 
+    @staticmethod
+    def _open_controller(ifname):
+        controller = EtherCATController(ifname)
+        try:
+            controller.start_communication()
+        except Exception:
+            controller.stop_communication()
+            raise
+        return controller
+
+    def _finish_connect(self, future):
+        if not future.done():
+            self.root.after(STATUS_UPDATE_MS, self._finish_connect, future)
+            return
+
+        self._connect_future = None
+        self.connect_btn.config(state=tk.NORMAL)
+        try:
+            self.controller = future.result()
         except ConnectionError as e:
             messagebox.showerror("Connection Failed", f"Could not open the network interface.\n\nError: {e}\n\n- Ensure Npcap/WinPcap is installed (Windows).\n- Run this script with administrator/root privileges.\n- Verify the interface name is correct.")
-            if self.controller: self.controller.stop_communication()
-            self.controller = None
         except pysoem.SdoError as e:
             messagebox.showerror("Configuration Failed", f"Failed to configure the drive (SDO Error).\n\nError: {e}\n\n- Check drive's manual for the specific SDO and error code.")
-            if self.controller: self.controller.stop_communication()
-            self.controller = None
         except Exception as e:
             messagebox.showerror("An Error Occurred", str(e))
-            if self.controller: self.controller.stop_communication()
-            self.controller = None
+        else:
+            self.connection_status.set(f"Connected to {self.controller.slave_count} slave(s)")
+            self.connect_btn.config(text="Disconnect")
+            self._toggle_controls(tk.NORMAL)
+            
+            self.start_status_updates()
+            return
+
+        self.controller = None
+        self.connection_status.set("Disconnected")
 
     def disconnect(self):
         self.stop_status_updates()
@@ -375,12 +660,14 @@ class ServoGUI:
         
         self.connection_status.set("Disconnected")
         self.drive_state.set("N/A")
+        self._last = (None,) * 4
+        self._last_cycle = None
         self.connect_btn.config(text="Connect")
         self._toggle_controls(tk.DISABLED)
         
     def start_status_updates(self):
-        self._update_status()
-        self.update_job = self.root.after(100, self.start_status_updates)
+        if self.update_job is None:
+            self.update_job = self.root.after(STATUS_UPDATE_MS, self._update_status)
 
     def stop_status_updates(self):
         if self.update_job:
@@ -388,30 +675,40 @@ class ServoGUI:
             self.update_job = None
 
     def _update_status(self):
-        if self.controller and self.controller.is_running:
-            status = self.controller.get_status()
-            sw = status["status_word"]
+        self.update_job = self.root.after(STATUS_UPDATE_MS, self._update_status)
+        controller = self.controller
+        if controller and controller.is_running:
+            # Skip the refresh when no bus cycle has completed since the last one
+            cycle = controller.cycle_count
+            if cycle == self._last_cycle:
+                return
+            self._last_cycle = cycle
+
+            status = self._telemetry
+            controller.read_into(status)
+            current = (status.sw, status.pos, status.vel, status.mode)
+            last = self._last
+            if current == last:
+                return
+            sw, pos, vel, mode = current
             
-            self.status_word_val.set(f"0x{sw:04X}")
-            self.actual_pos_val.set(str(status["actual_position"]))
-            self.actual_vel_val.set(str(status["actual_velocity"]))
-            self.mode_display_val.set(str(status["mode_display"]))
-            self.drive_state.set(self.controller.parse_status_word(sw))
+            # Only touch the Tk variables whose value actually changed
+            if sw != last[0]:
+                self.status_word_val.set("0x" + format(sw, "04X"))
+                self.drive_state.set(controller.parse_status_word(sw))
+            if pos != last[1]:
+                self.actual_pos_val.set(pos)
+            if vel != last[2]:
+                self.actual_vel_val.set(vel)
+            if mode != last[3]:
+                self.mode_display_val.set(mode)
+            self._last = current
 
     def reset_drive_fault(self):
         if self.controller: self.controller.reset_fault()
 
     def enable_drive(self):
-        if self.controller:
-            threading.Thread(target=self._enable_drive_sequence).start()
-            
-    def _enable_drive_sequence(self):
-        if self.controller:
-            self.controller.shutdown()
-            time.sleep(0.1)
-            self.controller.switch_on()
-            time.sleep(0.1)
-            self.controller.enable_operation()
+        if self.controller: self.controller.enable_drive()
 
     def set_mode(self):
         if self.controller: self.controller.set_operation_mode(self.operation_mode.get())
@@ -420,10 +717,7 @@ class ServoGUI:
         if self.controller:
             try:
                 pos = int(self.target_pos.get())
-                self.controller.set_operation_mode(MODE_PROFILED_POSITION)
-                time.sleep(0.01)
-                self.controller.set_target_position(pos)
-                self.controller.trigger_position_move()
+                self.controller.move_to_position(pos)
             except ValueError: messagebox.showerror("Invalid Input", "Position must be an integer.")
             except Exception as e: messagebox.showerror("Error", f"Could not perform move: {e}")
 
@@ -431,17 +725,26 @@ class ServoGUI:
         if self.controller:
             try:
                 vel = int(self.target_vel.get())
-                self.controller.set_operation_mode(MODE_PROFILED_VELOCITY)
-                time.sleep(0.01)
-                self.controller.set_target_velocity(vel)
+                self.controller.run_at_velocity(vel)
             except ValueError: messagebox.showerror("Invalid Input", "Velocity must be an integer.")
             except Exception as e: messagebox.showerror("Error", f"Could not run at velocity: {e}")
 
     def _on_closing(self):
         if self.controller and self.controller.is_running:
             self.disconnect()
+        if self._connect_future is not None:
+            # A bring-up still in flight would leave the bus in OP; stop its
+            # controller as soon as it is returned (runs on the worker thread)
+            self._connect_future.add_done_callback(self._discard_controller)
+        self._worker.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
 
+    @staticmethod
+    def _discard_controller(future):
+        if future.cancelled() or future.exception() is not None:
+            return # Never started, or already cleaned up by _open_controller
+        future.result().stop_communication()
+
 if __name__ == '__main__':
     root = tk.Tk()
     app = ServoGUI(root)